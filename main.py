@@ -5,10 +5,15 @@ import sys
 from linkdapi import AsyncLinkdAPI
 from rich.console import Console
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from src.utils.config import Config
 from src.utils.export import export_to_csv, export_to_json, export_to_tree
 from src.utils.input_helpers import safe_input
-from src.api.client import LeadsAPIClient
+from src.api.client import LeadsAPIClient, create_api_session
 from src.discovery.tree_discovery import ProfileTreeDiscovery
 from src.cli.menu import InteractiveMenu
 from src.cli.display import (
@@ -29,6 +34,8 @@ class LinkedInLeadsDiscoveryApp:
         self.menu = InteractiveMenu()
         self.discovery_result = None
         self.has_unsaved_data = False
+        self.use_cache = True
+        self._api = None
 
     async def run(self):
         """Main application loop"""
@@ -36,7 +43,12 @@ class LinkedInLeadsDiscoveryApp:
             while True:
                 # Show header with current profiles count and save status
                 profiles_count = len(self.discovery_result['profiles']) if self.discovery_result else 0
-                show_header(self.config, profiles_count, has_unsaved_data=self.has_unsaved_data)
+                show_header(
+                    self.config,
+                    profiles_count,
+                    has_unsaved_data=self.has_unsaved_data,
+                    cache_enabled=self.use_cache
+                )
 
                 try:
                     action = await self.menu.show_main_menu()
@@ -57,6 +69,8 @@ class LinkedInLeadsDiscoveryApp:
                         await self.view_profiles_tree()
                     elif action == "Export profiles":
                         await self.export_profiles()
+                    elif action == "Toggle profile cache":
+                        self.toggle_cache()
                     elif action == "Exit":
                         if await self.handle_exit():
                             break
@@ -82,6 +96,21 @@ class LinkedInLeadsDiscoveryApp:
             # Final Ctrl+C during exit handling
             console.print("\n[yellow]Force exit[/]")
 
+        finally:
+            await self._close_api()
+
+    async def _ensure_api(self) -> AsyncLinkdAPI:
+        """Create the shared LinkdAPI session on first use"""
+        if self._api is None:
+            self._api = await create_api_session(self.config.api_key, self.config.limit_per_host)
+        return self._api
+
+    async def _close_api(self):
+        """Close the shared LinkdAPI session if it was opened"""
+        if self._api is not None:
+            await self._api.close()
+            self._api = None
+
     async def discover_from_input(self):
         """Start discovery from user input"""
         usernames = await self.menu.get_usernames_input()
@@ -102,7 +131,7 @@ class LinkedInLeadsDiscoveryApp:
         if filepath is None:
             return
 
-        usernames = self.menu.load_usernames_from_file(filepath)
+        usernames = await self.menu.load_usernames_from_file(filepath)
 
         if not usernames:
             return
@@ -122,7 +151,11 @@ class LinkedInLeadsDiscoveryApp:
         api_client = LeadsAPIClient(
             api_key=self.config.api_key,
             max_retries=self.config.max_retries,
-            retry_delay=self.config.retry_delay
+            retry_delay=self.config.retry_delay,
+            max_concurrent=self.config.max_concurrent,
+            rate_limit=self.config.rate_limit,
+            rate_period=self.config.rate_period,
+            cache_dir=self.config.cache_dir if self.use_cache else None
         )
 
         discovery = ProfileTreeDiscovery(
@@ -131,12 +164,12 @@ class LinkedInLeadsDiscoveryApp:
         )
 
         try:
-            async with AsyncLinkdAPI(self.config.api_key) as api:
-                self.discovery_result = await discovery.discover_from_usernames(
-                    usernames,
-                    depth,
-                    api
-                )
+            api = await self._ensure_api()
+            self.discovery_result = await discovery.discover_from_usernames(
+                usernames,
+                depth,
+                api
+            )
 
             console.print(f"\n[bold cyan]{'='*60}[/]")
             console.print(f"[bold green]✓ Discovery completed![/]")
@@ -202,6 +235,15 @@ class LinkedInLeadsDiscoveryApp:
             except:
                 pass
 
+        finally:
+            api_client.close()
+
+    def toggle_cache(self):
+        """Enable or disable the persistent profile cache"""
+        self.use_cache = not self.use_cache
+        state = "enabled" if self.use_cache else "disabled"
+        console.print(f"[cyan]Profile cache {state}[/]")
+
     async def view_profiles(self):
         """View discovered profiles in table format"""
         if not self.discovery_result or not self.discovery_result['profiles']:
@@ -209,7 +251,8 @@ class LinkedInLeadsDiscoveryApp:
             safe_input()
             return
 
-        show_profiles_table(self.discovery_result['profiles'])
+        # Render off the event loop so background work keeps running
+        await asyncio.to_thread(show_profiles_table, self.discovery_result['profiles'])
         safe_input()
 
     async def view_profiles_tree(self):
@@ -219,7 +262,7 @@ class LinkedInLeadsDiscoveryApp:
             safe_input()
             return
 
-        show_profiles_tree(self.discovery_result['profiles'])
+        await asyncio.to_thread(show_profiles_tree, self.discovery_result['profiles'])
         safe_input()
 
     async def export_profiles(self):
@@ -298,4 +341,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -1,31 +1,173 @@
 """LinkdAPI client wrapper for profile discovery"""
 
 import asyncio
+import random
+import re
 from typing import Optional, Dict, Tuple
+import diskcache
+import httpx
+from aiolimiter import AsyncLimiter
 from linkdapi import AsyncLinkdAPI
 
+_NON_RETRYABLE_RE = re.compile(r"not found|doesn't exist|cannot be displayed", re.IGNORECASE)
+_RATE_LIMIT_RE = re.compile(r"429|too many requests", re.IGNORECASE)
+
+# Persistent cache entries expire after a week
+_CACHE_EXPIRE = 7 * 24 * 3600
+
+
+async def create_api_session(api_key: str, limit_per_host: int = 64) -> AsyncLinkdAPI:
+    """
+    Create a LinkdAPI session backed by a tuned HTTP/2 connection pool
+    LinkdAPI is a single host, so the pool size is the per-host limit
+    Its built-in retries are disabled so LeadsAPIClient is the only retry layer
+    """
+    api = AsyncLinkdAPI(api_key, max_retries=0)
+    await api.client.aclose()
+    api.client = httpx.AsyncClient(
+        timeout=api.timeout,
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=limit_per_host,
+            max_keepalive_connections=limit_per_host,
+            keepalive_expiry=30
+        )
+    )
+    return api
+
 
 class LeadsAPIClient:
     """Wrapper for LinkdAPI client focused on leads discovery"""
 
-    def __init__(self, api_key: str, max_retries: int = 3, retry_delay: int = 2, log_callback=None):
+    def __init__(
+        self,
+        api_key: str,
+        max_retries: int = 3,
+        retry_delay: int = 2,
+        max_concurrent: int = 10,
+        rate_limit: int = 10,
+        rate_period: float = 1,
+        cache_dir: Optional[str] = None,
+        log_callback=None
+    ):
         self.api_key = api_key
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self.rate_limit = rate_limit
+        self.rate_period = rate_period
+        self.rate_limiter = AsyncLimiter(rate_limit, rate_period)
+        self._rate_changed_at: Optional[float] = None  # loop time of the last rate adjustment
         self.log_callback = log_callback
+        self._profile_cache: Dict[str, Tuple] = {}
+        self._similar_cache: Dict[str, Tuple] = {}
+        self._inflight: Dict[str, asyncio.Event] = {}
+        self.cache = diskcache.Cache(cache_dir) if cache_dir else None
+
+    def close(self):
+        """Close the persistent cache"""
+        if self.cache is not None:
+            self.cache.close()
 
     def _log(self, message: str):
         """Log a message using callback if available"""
         if self.log_callback:
             self.log_callback(message)
 
+    def _set_rate(self, rate: int):
+        """Change the limiter rate in place, keeping its current level and waiters"""
+        limiter = self.rate_limiter
+        limiter._leak()  # drain what the old rate allowed so far
+        limiter.max_rate = rate
+        limiter._rate_per_sec = rate / limiter.time_period
+        self._rate_changed_at = asyncio.get_running_loop().time()
+
+    def _rate_recently_changed(self) -> bool:
+        """Check if the rate was adjusted within the current period"""
+        if self._rate_changed_at is None:
+            return False
+        return asyncio.get_running_loop().time() - self._rate_changed_at < self.rate_period
+
+    def _throttle_from_headers(self, headers) -> Optional[float]:
+        """
+        Halve the rate limit when the API signals we are over budget
+        Concurrent rate limit errors inside one period only count once
+        Returns: Retry-After value in seconds if present
+        """
+        if not headers:
+            return None
+
+        retry_after = None
+        try:
+            retry_after = float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            pass
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        exhausted = remaining is not None and remaining.strip() == '0'
+
+        limiter = self.rate_limiter
+        if (retry_after is not None or exhausted) and limiter.max_rate > 1 and not self._rate_recently_changed():
+            new_rate = max(1, int(limiter.max_rate // 2))
+            self._set_rate(new_rate)
+            # Treat the bucket as full so nothing bursts out right after the API pushed back
+            limiter._level = max(limiter._level, new_rate)
+            self._log(f"[yellow]⏳ Rate limit reduced to {new_rate} requests per {self.rate_period:g}s[/]")
+
+        return retry_after
+
+    def _recover_rate(self):
+        """Raise a reduced rate limit by one step per period until it is back to the configured rate"""
+        limiter = self.rate_limiter
+        if limiter.max_rate >= self.rate_limit or self._rate_recently_changed():
+            return
+
+        new_rate = min(self.rate_limit, int(limiter.max_rate) + max(1, self.rate_limit // 10))
+        self._set_rate(new_rate)
+        if new_rate == self.rate_limit:
+            self._log(f"[green]✓ Rate limit restored to {new_rate} requests per {self.rate_period:g}s[/]")
+
+    async def _get_cached(self, cache: Dict[str, Tuple], namespace: str, key: str, fetch) -> Tuple:
+        """
+        Return a cached result or fetch it once
+        Concurrent misses for the same key wait on the in-flight request
+        """
+        cache_key = f"{namespace}:{key}"
+        while cache_key in self._inflight:
+            await self._inflight[cache_key].wait()
+
+        if key in cache:
+            return cache[key]
+
+        event = self._inflight[cache_key] = asyncio.Event()
+        try:
+            if self.cache is not None:
+                # diskcache is blocking SQLite I/O, so keep it off the event loop
+                data = await asyncio.to_thread(self.cache.get, cache_key)
+                if data is not None:
+                    cache[key] = (True, data, None)
+                    return cache[key]
+
+            result = await fetch()
+            if result[0]:
+                cache[key] = result
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.set, cache_key, result[1], expire=_CACHE_EXPIRE)
+            return result
+        finally:
+            del self._inflight[cache_key]
+            event.set()
+
     async def _make_api_call_with_retry(self, api_call, identifier: str):
         """Make an API call with retry logic"""
         last_error = None
 
         for attempt in range(self.max_retries):
             try:
-                response = await api_call()
+                async with self._sem:
+                    async with self.rate_limiter:
+                        response = await api_call()
 
                 if not response:
                     last_error = "Empty response"
@@ -37,8 +179,7 @@ class LeadsAPIClient:
                 if 'success' in response and not response['success']:
                     last_error = response.get('message', 'Unknown error')
 
-                    non_retryable = ["not found", "doesn't exist", "cannot be displayed"]
-                    if any(keyword in last_error.lower() for keyword in non_retryable):
+                    if _NON_RETRYABLE_RE.search(last_error):
                         return False, last_error
 
                     if attempt < self.max_retries - 1:
@@ -49,6 +190,7 @@ class LeadsAPIClient:
                     return False, last_error
 
                 if 'success' in response and response['success']:
+                    self._recover_rate()
                     return True, response
 
                 last_error = "Invalid response format"
@@ -57,11 +199,17 @@ class LeadsAPIClient:
             except Exception as e:
                 last_error = str(e)
 
-                if "429" in last_error or "too many requests" in last_error.lower():
+                retry_after = None
+                http_response = getattr(e, 'response', None)
+                if http_response is not None:
+                    retry_after = self._throttle_from_headers(http_response.headers)
+
+                if _RATE_LIMIT_RE.search(last_error):
                     if attempt < self.max_retries - 1:
-                        wait_time = self.retry_delay * (attempt + 1)
+                        # Exponential backoff with full jitter unless the API told us how long to wait
+                        wait_time = min(60, retry_after or random.uniform(0, self.retry_delay * (2 ** attempt)))
                         if attempt == 0:
-                            self._log(f"[yellow]⏳ ({identifier}) Rate limit hit - waiting {wait_time}s[/]")
+                            self._log(f"[yellow]⏳ ({identifier}) Rate limit hit - waiting {wait_time:.1f}s[/]")
                         await asyncio.sleep(wait_time)
                         continue
                     return False, "Rate limit exceeded"
@@ -79,6 +227,15 @@ class LeadsAPIClient:
         Get full profile from username
         Returns: (success, full_profile_data, error_message)
         """
+        return await self._get_cached(
+            self._profile_cache,
+            'profile',
+            username,
+            lambda: self._fetch_full_profile(api, username)
+        )
+
+    async def _fetch_full_profile(self, api: AsyncLinkdAPI, username: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """Fetch full profile from the API"""
         success, response = await self._make_api_call_with_retry(
             lambda: api.get_full_profile(username),
             username
@@ -101,6 +258,15 @@ class LeadsAPIClient:
         Get similar profiles for a given URN
         Returns: (success, profiles_list, error_message)
         """
+        return await self._get_cached(
+            self._similar_cache,
+            'similar',
+            urn,
+            lambda: self._fetch_similar_profiles(api, urn)
+        )
+
+    async def _fetch_similar_profiles(self, api: AsyncLinkdAPI, urn: str) -> Tuple[bool, list, Optional[str]]:
+        """Fetch similar profiles from the API"""
         success, response = await self._make_api_call_with_retry(
             lambda: api.get_similar_profiles(urn),
             urn[:20]
@@ -121,14 +287,30 @@ class LeadsAPIClient:
 
         return True, valid_profiles, None
 
+    async def _fetch_profile_result(self, api: AsyncLinkdAPI, username: str) -> Tuple:
+        """Get a full profile as a (username, success, profile_data, error_message) tuple"""
+        success, profile, error = await self.get_full_profile(api, username)
+        return (username, success, profile, error)
+
     async def get_full_profiles_batch(self, api: AsyncLinkdAPI, usernames: list) -> list:
         """
         Get full profiles for a list of usernames concurrently
         Returns: list of (username, success, profile_data, error_message) tuples
         """
-        async def fetch_one(username: str):
-            success, profile, error = await self.get_full_profile(api, username)
-            return (username, success, profile, error)
+        results = await asyncio.gather(*[self._fetch_profile_result(api, username) for username in usernames])
+        return results
 
-        results = await asyncio.gather(*[fetch_one(username) for username in usernames])
-        return results
\ No newline at end of file
+    async def iter_full_profiles(self, api: AsyncLinkdAPI, usernames: list):
+        """
+        Get full profiles for a list of usernames concurrently, in completion order
+        Close it with contextlib.aclosing so pending fetches are cancelled if the caller stops early
+        Yields: (username, success, profile_data, error_message) tuples
+        """
+        tasks = [asyncio.ensure_future(self._fetch_profile_result(api, username)) for username in usernames]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Cancel pending fetches when the generator is closed early
+            for task in tasks:
+                task.cancel()
\ No newline at end of file
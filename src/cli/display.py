@@ -1,24 +1,26 @@
 """Display utilities for CLI"""
 
 import os
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich.tree import Tree
 from rich import box
 from typing import List, Dict
-from collections import defaultdict
 
 console = Console()
 
 
 def clear_terminal():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if console.legacy_windows:
+        os.system('cls')
+    else:
+        console.clear()
 
 
-def show_header(config, profiles_count: int = 0, title: str = "Main Menu", has_unsaved_data: bool = False):
+def show_header(config, profiles_count: int = 0, title: str = "Main Menu", has_unsaved_data: bool = False, cache_enabled: bool = True):
     """Display application header with configuration"""
     clear_terminal()
 
@@ -49,6 +51,9 @@ def show_header(config, profiles_count: int = 0, title: str = "Main Menu", has_u
     header.append(f"  •  ", style="dim")
     header.append(f"Retries: ", style="dim")
     header.append(f"{config.max_retries}", style="cyan")
+    header.append(f"  •  ", style="dim")
+    header.append(f"Cache: ", style="dim")
+    header.append("On" if cache_enabled else "Off", style="cyan")
 
     # Branding section
     header.append("\n\n", style="dim")
@@ -65,8 +70,6 @@ def show_header(config, profiles_count: int = 0, title: str = "Main Menu", has_u
 
 def show_discovery_summary(result: Dict):
     """Display discovery summary"""
-    console.print("\n[bold cyan]═══ Discovery Summary ═══[/]")
-
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column(style="cyan")
     table.add_column(style="green bold")
@@ -76,12 +79,15 @@ def show_discovery_summary(result: Dict):
     table.add_row("Failed Usernames", str(len(result['failed_usernames'])))
     table.add_row("Failed URNs", str(len(result['failed_urns'])))
 
-    console.print(table)
+    # Render everything in a single print
+    renderables = ["\n[bold cyan]═══ Discovery Summary ═══[/]", table]
 
     if result['failed_usernames']:
-        console.print(f"\n[yellow]Failed usernames: {', '.join(result['failed_usernames'][:5])}")
+        renderables.append(f"\n[yellow]Failed usernames: {', '.join(result['failed_usernames'][:5])}")
         if len(result['failed_usernames']) > 5:
-            console.print(f"[dim]... and {len(result['failed_usernames']) - 5} more[/]")
+            renderables.append(f"[dim]... and {len(result['failed_usernames']) - 5} more[/]")
+
+    console.print(Group(*renderables))
 
 
 def show_profiles_table(profiles: List[Dict], max_rows: int = 20):
@@ -99,20 +105,23 @@ def show_profiles_table(profiles: List[Dict], max_rows: int = 20):
 
     for i, profile in enumerate(profiles[:max_rows]):
         depth = str(profile.get('depth_level', 0))
-        name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}".strip() or "N/A"
-        headline = profile.get('headline', 'N/A')[:32] + "..." if len(profile.get('headline', '')) > 35 else profile.get('headline', 'N/A')
+        first_name = profile.get('firstName') or ''
+        last_name = profile.get('lastName') or ''
+        name = f"{first_name} {last_name}".strip() or "N/A"
+
+        headline = profile.get('headline') or 'N/A'
+        if len(headline) > 35:
+            headline = headline[:32] + "..."
 
         # Get location
-        geo = profile.get('geo', {})
-        location = geo.get('city', 'N/A') if geo else 'N/A'
+        geo = profile.get('geo') or {}
+        location = geo.get('city') or 'N/A'
         if len(location) > 20:
             location = location[:17] + "..."
 
         # Get current company
-        positions = profile.get('position', [])
-        company = 'N/A'
-        if positions and len(positions) > 0:
-            company = positions[0].get('companyName', 'N/A')
+        positions = profile.get('position')
+        company = (positions[0].get('companyName') or 'N/A') if positions else 'N/A'
         if len(company) > 20:
             company = company[:17] + "..."
 
@@ -124,17 +133,40 @@ def show_profiles_table(profiles: List[Dict], max_rows: int = 20):
         console.print(f"[dim]... and {len(profiles) - max_rows} more profiles[/]")
 
 
+def _format_label(profile: Dict, children_count: int) -> str:
+    """Generate a readable label for a profile node"""
+    first_name = profile.get('firstName') or ''
+    last_name = profile.get('lastName') or ''
+    name = f"{first_name} {last_name}".strip() or profile.get('username', 'Unknown')
+
+    headline = profile.get('headline') or ''
+    if len(headline) > 43:
+        headline = headline[:40] + "..."
+
+    # Get location
+    geo = profile.get('geo') or {}
+    location = geo.get('city') or ''
+
+    label_parts = [f"[green]{name}[/]", f"[dim]│[/]", f"[yellow]{headline}[/]"]
+    if location:
+        label_parts.extend([f"[dim]│[/]", f"[cyan]{location}[/]"])
+    if children_count > 0:
+        label_parts.append(f"[dim]({children_count} discovered)[/]")
+
+    return " ".join(label_parts)
+
+
 def show_profiles_tree(profiles: List[Dict], max_children_per_node: int = 5):
     """Display profiles in an optimized tree structure showing discovery hierarchy"""
     if not profiles:
         console.print("[yellow]No profiles to display[/]")
         return
 
-    children_map = defaultdict(list)
+    children_map = {}
     for profile in profiles:
         source = profile.get('source_urn', '')
         if source:
-            children_map[source].append(profile)
+            children_map.setdefault(source, []).append(profile)
 
     # Find root profiles (depth 0 or no source)
     root_profiles = [p for p in profiles if p.get('depth_level', 0) == 0]
@@ -149,28 +181,9 @@ def show_profiles_tree(profiles: List[Dict], max_children_per_node: int = 5):
         guide_style="cyan dim"
     )
 
-    def get_profile_label(profile: Dict) -> str:
-        """Generate a readable label for a profile node"""
-        name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}".strip()
-        if not name:
-            name = profile.get('username', 'Unknown')
-
-        headline = profile.get('headline', '')[:40] + "..." if len(profile.get('headline', '')) > 43 else profile.get('headline', '')
-
-        # Get location
-        geo = profile.get('geo', {})
-        location = geo.get('city', '') if geo else ''
-
-        # Count children for this profile
-        children_count = len(children_map.get(profile['urn'], []))
-
-        label_parts = [f"[green]{name}[/]", f"[dim]│[/]", f"[yellow]{headline}[/]"]
-        if location:
-            label_parts.extend([f"[dim]│[/]", f"[cyan]{location}[/]"])
-        if children_count > 0:
-            label_parts.append(f"[dim]({children_count} discovered)[/]")
-
-        return " ".join(label_parts)
+    def label_of(profile: Dict) -> str:
+        """Format a label only for nodes that are actually shown"""
+        return _format_label(profile, len(children_map.get(profile['urn'], ())))
 
     def add_children_to_node(parent_node, parent_profile: Dict, current_depth: int = 0, max_depth: int = 3):
         """Recursively add children to a tree node with optimization"""
@@ -178,8 +191,7 @@ def show_profiles_tree(profiles: List[Dict], max_children_per_node: int = 5):
         if current_depth >= max_depth:
             return
 
-        parent_urn = parent_profile['urn']
-        children = children_map.get(parent_urn, [])
+        children = children_map.get(parent_profile['urn'])
 
         if not children:
             return
@@ -189,8 +201,7 @@ def show_profiles_tree(profiles: List[Dict], max_children_per_node: int = 5):
         hidden_count = len(children) - len(visible_children)
 
         for child in visible_children:
-            child_label = get_profile_label(child)
-            child_node = parent_node.add(child_label)
+            child_node = parent_node.add(label_of(child))
             # Recursively add grandchildren
             add_children_to_node(child_node, child, current_depth + 1, max_depth)
 
@@ -201,16 +212,12 @@ def show_profiles_tree(profiles: List[Dict], max_children_per_node: int = 5):
 
     # Add root profiles to tree
     for i, root in enumerate(root_profiles[:10]):  # Show max 10 root profiles
-        root_label = get_profile_label(root)
-        root_node = tree.add(f"[bold]{root_label}[/]")
+        root_node = tree.add(f"[bold]{label_of(root)}[/]")
         add_children_to_node(root_node, root, current_depth=0, max_depth=3)
 
     # Show summary if there are more root profiles
     if len(root_profiles) > 10:
         tree.add(f"[dim]... and {len(root_profiles) - 10} more starting profiles[/]")
 
-    console.print()
-    console.print(tree)
-    console.print()
-    console.print(f"[dim]Note: Showing up to {max_children_per_node} profiles per node and 3 levels deep for readability[/]")
-    console.print()
\ No newline at end of file
+    note = f"[dim]Note: Showing up to {max_children_per_node} profiles per node and 3 levels deep for readability[/]"
+    console.print(Group("", tree, "", note, ""))
\ No newline at end of file
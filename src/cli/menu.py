@@ -2,6 +2,7 @@
 
 import os
 import asyncio
+import aiofiles
 import questionary
 from rich.console import Console
 
@@ -28,6 +29,7 @@ class InteractiveMenu:
             "View discovered profiles (table)",
             "View discovered profiles (tree)",
             "Export profiles",
+            "Toggle profile cache",
             "Exit"
         ]
 
@@ -127,15 +129,20 @@ class InteractiveMenu:
             console.print("\n[yellow]⚠️  Interrupted[/]")
             return None
 
-    def load_usernames_from_file(self, filepath: str) -> list:
+    async def load_usernames_from_file(self, filepath: str) -> list:
         """Load usernames from a file"""
         if not os.path.exists(filepath):
             console.print(f"[red]File not found: {filepath}[/]")
             return []
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                usernames = [line.strip() for line in f if line.strip()]
+            async with aiofiles.open(filepath, 'r', encoding='utf-8') as f:
+                lines = await f.readlines()
+
+            # Deduplicate while preserving file order
+            usernames = list(dict.fromkeys(
+                username for username in (line.strip() for line in lines) if username
+            ))
 
             console.print(f"[green]Loaded {len(usernames)} usernames from {filepath}[/]")
             return usernames
@@ -1,8 +1,9 @@
 """Tree-based profile discovery with deduplication"""
 
 import asyncio
+from contextlib import aclosing
 from typing import List, Set, Dict
-from collections import deque
+from collections import deque, defaultdict
 from linkdapi import AsyncLinkdAPI
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.console import Console, Group
@@ -26,49 +27,82 @@ class ProfileTreeDiscovery:
         self.log_buffer = deque(maxlen=30)
         self.live_display = None
         self.progress = None
-        self.profile_lock = asyncio.Lock()  # Lock for thread-safe profile additions
+        self._task_id = None
+        self._dirty = asyncio.Event()  # Set when the live display needs a repaint
+        self._render_task = None
+        self._log_count = 0  # Total messages logged, used to detect log changes
+        self._header_cache = None  # (profiles count, panel)
+        self._log_cache = None  # (log count, panel)
+        self._rendered = None  # (header panel, log panel) last sent to the display
 
     def _add_log(self, message: str):
-        """Add message to log buffer and update display"""
+        """Add message to log buffer and schedule a display update"""
         self.log_buffer.append(message)
-        if self.live_display and self.progress:
-            try:
-                self.live_display.update(Group(self._get_status_header(), self.progress, self._get_log_panel()))
-            except:
-                pass
+        self._log_count += 1
+        self._dirty.set()
+
+    def _safe_render(self):
+        """Rebuild the live display from current state"""
+        if self.live_display is None or self.progress is None:
+            return
+
+        header = self._get_status_header()
+        log_panel = self._get_log_panel()
+
+        # Nothing changed since the last repaint
+        if self._rendered and self._rendered[0] is header and self._rendered[1] is log_panel:
+            return
+
+        self.live_display.update(Group(header, self.progress, log_panel))
+        self._rendered = (header, log_panel)
+
+    async def _renderer(self):
+        """Coalesce display updates into at most 10 repaints per second"""
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            self._safe_render()
+            await asyncio.sleep(0.1)
 
     def _get_log_panel(self):
-        """Create a panel with recent logs"""
+        """Create a panel with recent logs, reusing the last one if nothing was logged"""
+        if self._log_cache and self._log_cache[0] == self._log_count:
+            return self._log_cache[1]
+
         if not self.log_buffer:
-            return Panel("", title="[dim]Activity Log[/]", border_style="dim")
+            panel = Panel("", title="[dim]Activity Log[/]", border_style="dim")
+        else:
+            log_text = "\n".join(self.log_buffer)
+            panel_height = min(len(self.log_buffer) + 2, 22)
+            panel = Panel(log_text, title="[dim]Activity Log[/]", height=panel_height, border_style="dim")
 
-        log_text = "\n".join(list(self.log_buffer))
-        panel_height = min(len(self.log_buffer) + 2, 22)
-        return Panel(log_text, title="[dim]Activity Log[/]", height=panel_height, border_style="dim")
+        self._log_cache = (self._log_count, panel)
+        return panel
 
     def _get_status_header(self):
-        """Create status header showing real-time count"""
+        """Create status header showing real-time count, reusing the last one if unchanged"""
         from rich.text import Text
 
-        status = Text()
-        status.append("LinkedIn Leads Discovery", style="bold cyan")
-        status.append("  •  ", style="dim")
-        status.append("Discovering...", style="bold white")
-        status.append("  •  ", style="dim")
-        status.append(f"{len(self.discovered_profiles)} leads discovered", style="bold cyan")
-
-        return Panel(status, border_style="cyan", padding=(0, 2))
-
-    async def _add_discovered_profile(self, profile_data: Dict):
-        """Thread-safe method to add profile and update display in real-time"""
-        async with self.profile_lock:
-            self.discovered_profiles.append(profile_data)
-            # Update display immediately
-            if self.live_display and self.progress:
-                try:
-                    self.live_display.update(Group(self._get_status_header(), self.progress, self._get_log_panel()))
-                except:
-                    pass
+        count = len(self.discovered_profiles)
+        if self._header_cache and self._header_cache[0] == count:
+            return self._header_cache[1]
+
+        status = Text.from_markup(
+            "[bold cyan]LinkedIn Leads Discovery[/][dim]  •  [/][bold white]Discovering...[/]"
+            f"[dim]  •  [/][bold cyan]{count} leads discovered[/]"
+        )
+
+        panel = Panel(status, border_style="cyan", padding=(0, 2))
+        self._header_cache = (count, panel)
+        return panel
+
+    def _add_discovered_profile(self, profile_data: Dict):
+        """Add profile and schedule a display update"""
+        # Runs on the event loop without awaiting, so no lock is needed
+        self.discovered_profiles.append(profile_data)
+        if self.progress is not None:
+            self.progress.advance(self._task_id)
+        self._dirty.set()
 
     async def discover_from_usernames(
         self,
@@ -86,16 +120,16 @@ class ProfileTreeDiscovery:
         # Set up API client callback
         self.api_client.log_callback = self._add_log
 
-        # Create progress bar with percentage
+        # Create an indeterminate progress bar counting discovered profiles
         progress = Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%")
+            TextColumn("[progress.percentage]{task.completed} profiles")
         )
-        task = progress.add_task(
+        self._task_id = progress.add_task(
             "[cyan]Discovering profiles...",
-            total=depth
+            total=None
         )
 
         # Start Live display
@@ -107,41 +141,46 @@ class ProfileTreeDiscovery:
             ) as live:
                 self.live_display = live
                 self.progress = progress
+                self._render_task = asyncio.create_task(self._renderer())
 
-                starting_urns = []
-                for username in usernames:
-                    success, profile_data, error = await self.api_client.get_full_profile(api, username)
-
-                    if success and profile_data:
-                        urn = profile_data.get('urn')
-                        if urn and urn not in self.seen_urns:
-                            self.seen_urns.add(urn)
-                            # Store full profile data
-                            profile_data['depth'] = 0
-                            profile_data['source_urn'] = ''
-                            starting_urns.append(profile_data)
-                            self._add_log(f"[green]✓ {username} -> Full profile fetched[/]")
-                        elif urn:
-                            self._add_log(f"[yellow]⊘ {username} -> Already discovered[/]")
+                try:
+                    # Fetch all starting profiles concurrently (bounded by the client)
+                    results = await self.api_client.get_full_profiles_batch(api, usernames)
+
+                    starting_urns = []
+                    for username, success, profile_data, error in results:
+                        if success and profile_data:
+                            urn = profile_data.get('urn')
+                            if urn and urn not in self.seen_urns:
+                                self.seen_urns.add(urn)
+                                # Store full profile data
+                                profile_data['depth_level'] = 0
+                                profile_data['source_urn'] = ''
+                                starting_urns.append(profile_data)
+                                self._add_log(f"[green]✓ {username} -> Full profile fetched[/]")
+                            elif urn:
+                                self._add_log(f"[yellow]⊘ {username} -> Already discovered[/]")
+                            else:
+                                self.failed_usernames.append(username)
+                                self._add_log(f"[red]✗ {username} -> No URN in profile data[/]")
                         else:
                             self.failed_usernames.append(username)
-                            self._add_log(f"[red]✗ {username} -> No URN in profile data[/]")
-                    else:
-                        self.failed_usernames.append(username)
-                        self._add_log(f"[red]✗ {username} -> {error}[/]")
+                            self._add_log(f"[red]✗ {username} -> {error}[/]")
 
-                if not starting_urns:
-                    self._add_log("[red]No valid URNs found from provided usernames[/]")
-                    self.live_display = None
-                    self.progress = None
-                    return self._build_result()
+                    if not starting_urns:
+                        self._add_log("[red]No valid URNs found from provided usernames[/]")
+                        return self._build_result()
 
-                self._add_log(f"[green]Found {len(starting_urns)} starting profiles[/]")
+                    self._add_log(f"[green]Found {len(starting_urns)} starting profiles[/]")
 
-                await self._discover_tree_iterative(starting_urns, depth, api, progress, task)
+                    await self._discover_tree_iterative(starting_urns, depth, api)
 
-                self.live_display = None
-                self.progress = None
+                finally:
+                    # Paint the final state before the live display closes
+                    self._render_task.cancel()
+                    self._safe_render()
+                    self.live_display = None
+                    self.progress = None
 
         except KeyboardInterrupt:
             # Clean up display
@@ -156,137 +195,135 @@ class ProfileTreeDiscovery:
         self,
         starting_profiles: List[Dict],
         max_depth: int,
-        api: AsyncLinkdAPI,
-        progress: Progress,
-        task_id
+        api: AsyncLinkdAPI
     ):
-        """Iteratively discover profiles using queue (no recursion)"""
-        # Queue stores tuples of (profile_info, depth_level)
-        queue = [(profile, 0) for profile in starting_profiles]
-        current_depth_level = 0
-
-        while queue:
-            # Get all profiles at current depth level
-            current_batch = []
-            remaining = []
-
-            for profile_info, depth_level in queue:
-                if depth_level == current_depth_level:
-                    current_batch.append(profile_info)
+        """Discover profiles with a pool of workers sharing one queue (no recursion)"""
+        # Save starting profiles
+        for profile_info in starting_profiles:
+            if 'urn' in profile_info:
+                self._add_discovered_profile(profile_info)
+
+        if max_depth <= 0:
+            return
+
+        # Queue holds profiles waiting to be expanded; children are queued as soon
+        # as their parent returns, so similar lookups overlap across depth levels.
+        # Claiming URNs stays level-synchronous: a profile only claims its similar
+        # URNs once every shallower level has claimed its own, so each profile keeps
+        # its BFS depth and parent no matter which request finishes first
+        queue: asyncio.Queue = asyncio.Queue()
+        queued = defaultdict(int)      # profiles queued per depth level
+        expanded = defaultdict(int)    # profiles expanded per depth level
+        found = defaultdict(int)       # new profiles discovered per depth level
+        level_done = defaultdict(asyncio.Event)  # set once every shallower level is expanded
+        level_done[0].set()
+        completed_depth = 0
+
+        def enqueue(profile_info: Dict):
+            queued[profile_info.get('depth_level', 0)] += 1
+            queue.put_nowait(profile_info)
+
+        def mark_expanded(depth_level: int):
+            nonlocal completed_depth
+            expanded[depth_level] += 1
+
+            # A level is complete once every profile queued at it (and above it) is expanded
+            while (completed_depth < max_depth
+                   and queued[completed_depth]
+                   and expanded[completed_depth] == queued[completed_depth]):
+                completed_depth += 1
+                level_done[completed_depth].set()
+                self._add_log(f"[cyan]✓ Depth {completed_depth} complete: Found {found[completed_depth]} new profiles[/]")
+                self._add_log(f"[cyan]  Total discovered: {len(self.discovered_profiles)}[/]")
+
+                if completed_depth < max_depth and queued[completed_depth]:
+                    self._add_log(f"[cyan]→ Processing depth level {completed_depth + 1}/{max_depth}[/]")
+
+        async def process_profile(profile_info: Dict):
+            urn = profile_info['urn']
+            current_depth_val = profile_info.get('depth_level', 0)
+
+            success, similar_profiles, error = await self.api_client.get_similar_profiles(api, urn)
+
+            if success:
+                # Wait for shallower levels to finish claiming before claiming anything
+                await level_done[current_depth_val].wait()
+
+                # Get unique usernames from similar profiles
+                usernames_to_fetch = []
+                for similar in similar_profiles:
+                    similar_urn = similar.get('urn')
+                    similar_username = similar.get('username') or similar.get('publicIdentifier')
+                    if similar_urn and similar_username and similar_urn not in self.seen_urns:
+                        usernames_to_fetch.append(similar_username)
+                        self.seen_urns.add(similar_urn)
+
+                if not usernames_to_fetch:
+                    self._add_log(f"[yellow]⊘ {urn[:20]}... -> No new profiles (all seen before)[/]")
+                    return []
+
+                # Fetch full profiles for all similar profiles, queueing each one as it arrives
+                new_profiles = []
+                async with aclosing(self.api_client.iter_full_profiles(api, usernames_to_fetch)) as results:
+                    async for username, fetch_success, full_profile, fetch_error in results:
+                        if fetch_success and full_profile:
+                            full_profile['depth_level'] = current_depth_val + 1
+                            full_profile['source_urn'] = urn
+
+                            # Add to discovered profiles immediately for real-time counter update
+                            self._add_discovered_profile(full_profile)
+
+                            new_profiles.append(full_profile)
+                            found[full_profile['depth_level']] += 1
+
+                            # Profiles at max depth are kept as leaves and never expanded
+                            if full_profile['depth_level'] < max_depth:
+                                enqueue(full_profile)
+                        else:
+                            self._add_log(f"[yellow]⚠ {username} -> Failed to fetch full profile: {fetch_error}[/]")
+
+                if new_profiles:
+                    self._add_log(f"[green]✓ {urn[:20]}... -> Fetched {len(new_profiles)} full profiles[/]")
                 else:
-                    remaining.append((profile_info, depth_level))
-
-            queue = remaining
-
-            if not current_batch:
-                current_depth_level += 1
-                continue
-
-            # Save all profiles in current batch (only for starting profiles at depth 0)
-            if current_depth_level == 0:
-                for profile_info in current_batch:
-                    if 'urn' in profile_info:
-                        profile_data = profile_info.copy()
-                        profile_data['depth_level'] = profile_info.get('depth', 0)
-                        if 'depth' in profile_data:
-                            del profile_data['depth']
-                        await self._add_discovered_profile(profile_data)
-
-            # Update progress
-            progress.update(
-                task_id,
-                completed=current_depth_level
-            )
-            if self.live_display:
-                self.live_display.update(Group(self._get_status_header(), progress, self._get_log_panel()))
-
-            # Stop if we've reached max depth
-            if current_depth_level >= max_depth:
-                break
-
-            self._add_log(f"[cyan]→ Processing depth level {current_depth_level + 1}/{max_depth}[/]")
-
-            # Process all profiles in current batch concurrently
-            semaphore = asyncio.Semaphore(self.max_concurrent)
-
-            async def process_profile(profile_info: Dict):
-                async with semaphore:
-                    urn = profile_info['urn']
-                    current_depth_val = profile_info.get('depth', 0)
-
-                    success, similar_profiles, error = await self.api_client.get_similar_profiles(api, urn)
-
-                    if success:
-                        # Get unique usernames from similar profiles
-                        usernames_to_fetch = []
-                        for similar in similar_profiles:
-                            similar_urn = similar.get('urn')
-                            similar_username = similar.get('username') or similar.get('publicIdentifier')
-                            if similar_urn and similar_username and similar_urn not in self.seen_urns:
-                                usernames_to_fetch.append(similar_username)
-                                self.seen_urns.add(similar_urn)
-
-                        if not usernames_to_fetch:
-                            self._add_log(f"[yellow]⊘ {urn[:20]}... -> No new profiles (all seen before)[/]")
-                            return []
-
-                        # Fetch full profiles for all similar profiles
-                        full_profile_results = await self.api_client.get_full_profiles_batch(api, usernames_to_fetch)
-
-                        new_profiles = []
-                        for username, fetch_success, full_profile, fetch_error in full_profile_results:
-                            if fetch_success and full_profile:
-                                full_profile['depth'] = current_depth_val + 1
-                                full_profile['source_urn'] = urn
-
-                                # Add to discovered profiles immediately for real-time counter update
-                                profile_to_save = full_profile.copy()
-                                profile_to_save['depth_level'] = full_profile['depth']
-                                if 'depth' in profile_to_save:
-                                    del profile_to_save['depth']
-                                await self._add_discovered_profile(profile_to_save)
-
-                                new_profiles.append(full_profile)
-                            else:
-                                self._add_log(f"[yellow]⚠ {username} -> Failed to fetch full profile: {fetch_error}[/]")
+                    self._add_log(f"[yellow]⊘ {urn[:20]}... -> No profiles fetched[/]")
 
-                        if new_profiles:
-                            self._add_log(f"[green]✓ {urn[:20]}... -> Fetched {len(new_profiles)} full profiles[/]")
-                        else:
-                            self._add_log(f"[yellow]⊘ {urn[:20]}... -> No profiles fetched[/]")
-
-                        return new_profiles
-                    else:
-                        self.failed_urns.append(urn)
-                        self._add_log(f"[red]✗ {urn[:20]}... -> {error}[/]")
-                        return []
-
-            tasks = [process_profile(profile_info) for profile_info in current_batch]
-
-            try:
-                results = await asyncio.gather(*tasks)
-            except (KeyboardInterrupt, asyncio.CancelledError):
-                # Stop processing if interrupted
-                self._add_log("[yellow]⚠ Discovery interrupted during batch processing[/]")
-                raise KeyboardInterrupt  # Re-raise as KeyboardInterrupt for consistency
-
-            # Add new profiles to queue
-            for result in results:
-                for profile in result:
-                    queue.append((profile, profile['depth']))
-
-            # Update progress
-            progress.update(
-                task_id,
-                completed=current_depth_level + 1
-            )
-            if self.live_display:
-                self.live_display.update(Group(self._get_status_header(), progress, self._get_log_panel()))
-
-            self._add_log(f"[cyan]✓ Depth {current_depth_level + 1} complete: Found {len([p for p in results for _ in p])} new profiles[/]")
-            self._add_log(f"[cyan]  Total discovered: {len(self.discovered_profiles)}[/]")
-
-            current_depth_level += 1
+                return new_profiles
+            else:
+                self.failed_urns.append(urn)
+                self._add_log(f"[red]✗ {urn[:20]}... -> {error}[/]")
+                return []
+
+        async def worker():
+            while True:
+                profile_info = await queue.get()
+                try:
+                    await process_profile(profile_info)
+                    mark_expanded(profile_info.get('depth_level', 0))
+                finally:
+                    queue.task_done()
+
+        for profile_info in starting_profiles:
+            enqueue(profile_info)
+
+        self._add_log(f"[cyan]→ Processing depth level 1/{max_depth}[/]")
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrent)]
+        drained = asyncio.create_task(queue.join())
+
+        try:
+            done, _ = await asyncio.wait([drained, *workers], return_when=asyncio.FIRST_COMPLETED)
+            # A worker only finishes early if it raised; surface that error
+            for finished in done:
+                if finished is not drained:
+                    finished.result()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Stop processing if interrupted
+            self._add_log("[yellow]⚠ Discovery interrupted during batch processing[/]")
+            raise KeyboardInterrupt  # Re-raise as KeyboardInterrupt for consistency
+        finally:
+            for task in [drained, *workers]:
+                task.cancel()
+            await asyncio.gather(drained, *workers, return_exceptions=True)
 
     def _build_result(self) -> Dict:
         """Build final result dictionary"""
@@ -45,6 +45,11 @@ class Config:
         """Get the maximum concurrent requests"""
         return int(self.config.get('SETTINGS', 'max_concurrent_requests', fallback='10'))
 
+    @property
+    def limit_per_host(self) -> int:
+        """Get the maximum number of pooled connections to the API host"""
+        return int(self.config.get('SETTINGS', 'limit_per_host', fallback='64'))
+
     @property
     def output_dir(self) -> str:
         """Get the output directory"""
@@ -62,6 +67,21 @@ class Config:
         """Get the retry delay in seconds"""
         return int(self.config.get('SETTINGS', 'retry_delay', fallback='2'))
 
+    @property
+    def rate_limit(self) -> int:
+        """Get the maximum number of requests per rate period"""
+        return int(self.config.get('SETTINGS', 'rate_limit', fallback='10'))
+
+    @property
+    def rate_period(self) -> float:
+        """Get the rate limit period in seconds"""
+        return float(self.config.get('SETTINGS', 'rate_period', fallback='1'))
+
+    @property
+    def cache_dir(self) -> str:
+        """Get the persistent cache directory"""
+        return self.config.get('SETTINGS', 'cache_directory', fallback='cache')
+
     @property
     def default_depth(self) -> int:
         """Get the default tree depth"""
@@ -1,18 +1,37 @@
 """Export functionality for discovered profiles"""
 
-import json
+import asyncio
 import csv
+import operator
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from rich.console import Console
 from collections import defaultdict
 
+try:
+    import orjson
+
+    def _dump_json(profiles: List[Dict]) -> bytes:
+        """Serialize profiles to indented UTF-8 JSON"""
+        return orjson.dumps(profiles, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+
+    def _dump_json(profiles: List[Dict]) -> bytes:
+        """Serialize profiles to indented UTF-8 JSON"""
+        return json.dumps(profiles, indent=2, ensure_ascii=False).encode('utf-8')
+
 console = Console()
 
 
 async def export_to_json(profiles: List[Dict], output_dir: str, filename: str = None) -> str:
     """Export profiles to JSON file"""
+    return await asyncio.to_thread(_export_to_json_sync, profiles, output_dir, filename)
+
+
+def _export_to_json_sync(profiles: List[Dict], output_dir: str, filename: str = None) -> str:
+    """Export profiles to JSON file (blocking)"""
     if not filename:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"linkedin_leads_{timestamp}.json"
@@ -22,14 +41,19 @@ async def export_to_json(profiles: List[Dict], output_dir: str, filename: str =
 
     filepath = Path(output_dir) / filename
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(profiles, f, indent=2, ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(_dump_json(profiles))
 
     return str(filepath)
 
 
 async def export_to_csv(profiles: List[Dict], output_dir: str, filename: str = None) -> str:
     """Export profiles to CSV file"""
+    return await asyncio.to_thread(_export_to_csv_sync, profiles, output_dir, filename)
+
+
+def _export_to_csv_sync(profiles: List[Dict], output_dir: str, filename: str = None) -> str:
+    """Export profiles to CSV file (blocking)"""
     if not profiles:
         console.print("[yellow]No profiles to export[/]")
         return None
@@ -43,90 +67,133 @@ async def export_to_csv(profiles: List[Dict], output_dir: str, filename: str = N
 
     filepath = Path(output_dir) / filename
 
-    flattened_profiles = [flatten_profile(profile) for profile in profiles]
+    # Flatten and collect columns that have a value in at least one row in a single pass
+    flattened_profiles = []
+    non_empty_keys = set()
+    for profile in profiles:
+        flattened = flatten_profile(profile)
+        flattened_profiles.append(flattened)
+        non_empty_keys.update(key for key, value in flattened.items() if value)
 
     if not flattened_profiles:
         console.print("[yellow]No data to write to CSV[/]")
         return None
 
-    all_keys = set()
-    for profile in flattened_profiles:
-        all_keys.update(profile.keys())
-
-    non_empty_keys = set()
-    for key in all_keys:
-        if any(profile.get(key) for profile in flattened_profiles):
-            non_empty_keys.add(key)
-
     fieldnames = sorted(non_empty_keys)
 
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(flattened_profiles)
+    with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(_iter_rows(flattened_profiles, fieldnames))
 
     return str(filepath)
 
 
+def _iter_rows(flattened_profiles: List[Dict], fieldnames: List[str]):
+    """Yield CSV rows as tuples in fieldnames order"""
+    # Missing keys fall back to '' like csv.DictWriter's default restval
+    defaults = dict.fromkeys(fieldnames, '')
+    if len(fieldnames) > 1:
+        getter = operator.itemgetter(*fieldnames)
+    else:
+        # itemgetter needs at least one key and returns a bare value for one
+        getter = lambda row: tuple(row[key] for key in fieldnames)
+    for profile in flattened_profiles:
+        yield getter({**defaults, **profile})
+
+
 def flatten_profile(profile: Dict) -> Dict:
     """Flatten nested profile data for CSV export"""
+    # Bind the lookup once; this runs for every exported profile
+    get = profile.get
+
     flattened = {
-        'id': profile.get('id', ''),
-        'urn': profile.get('urn', ''),
-        'username': profile.get('username', ''),
-        'firstName': profile.get('firstName', ''),
-        'lastName': profile.get('lastName', ''),
-        'headline': profile.get('headline', ''),
-        'summary': profile.get('summary', ''),
-        'isCreator': profile.get('isCreator', False),
-        'isPremium': profile.get('isPremium', False),
-        'profilePicture': profile.get('profilePicture', ''),
-        'depth_level': profile.get('depth_level', 0),
-        'source_urn': profile.get('source_urn', ''),
+        'id': get('id', ''),
+        'urn': get('urn', ''),
+        'username': get('username', ''),
+        'firstName': get('firstName', ''),
+        'lastName': get('lastName', ''),
+        'headline': get('headline', ''),
+        'summary': get('summary', ''),
+        'isCreator': get('isCreator', False),
+        'isPremium': get('isPremium', False),
+        'profilePicture': get('profilePicture', ''),
+        'depth_level': get('depth_level', 0),
+        'source_urn': get('source_urn', ''),
     }
 
     # Extract geo info
-    geo = profile.get('geo', {})
+    geo = get('geo')
     if geo:
         flattened['location'] = geo.get('full', '')
         flattened['country'] = geo.get('country', '')
         flattened['city'] = geo.get('city', '')
 
     # Extract languages
-    languages = profile.get('languages', [])
+    languages = get('languages')
     if languages:
         flattened['languages'] = ', '.join([lang.get('name', '') for lang in languages[:3]])
 
     # Extract current position (first position in array)
-    positions = profile.get('position', [])
-    if positions and len(positions) > 0:
+    positions = get('position')
+    if positions:
         current_pos = positions[0]
         flattened['current_title'] = current_pos.get('title', '')
         flattened['current_company'] = current_pos.get('companyName', '')
         flattened['current_company_url'] = current_pos.get('companyURL', '')
 
     # Extract skills (first 10)
-    skills = profile.get('skills', [])
+    skills = get('skills')
     if skills:
         flattened['skills'] = ', '.join([skill.get('name', '') for skill in skills[:10]])
 
     # Extract education (first one)
-    educations = profile.get('educations', [])
-    if educations and len(educations) > 0:
-        edu = educations[0]
-        flattened['education'] = edu.get('schoolName', '')
+    educations = get('educations')
+    if educations:
+        flattened['education'] = educations[0].get('schoolName', '')
 
     return flattened
 
 
+def _tree_text_parts(profile: Dict) -> Tuple[str, str]:
+    """
+    Generate text representation of profile for the tree export
+    Returns: (summary, link) - the discovered count goes between them
+    """
+    name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}".strip()
+    if not name:
+        name = profile.get('username', 'Unknown')
+
+    headline = profile.get('headline', 'No headline')
+    username = profile.get('username', 'N/A')
+
+    # Get location
+    geo = profile.get('geo', {})
+    location = geo.get('full', '') if geo else ''
+
+    text = f"{name} | {headline}"
+    if location:
+        text += f" | {location}"
+
+    return text, f"\n    LinkedIn: linkedin.com/in/{username}"
+
+
 async def export_to_tree(profiles: List[Dict], output_dir: str, filename: str = None, max_children_per_node: int = 10) -> str:
     """Export profiles as tree structure to TXT file"""
+    return await asyncio.to_thread(_export_to_tree_sync, profiles, output_dir, filename, max_children_per_node)
+
+
+def _export_to_tree_sync(profiles: List[Dict], output_dir: str, filename: str = None, max_children_per_node: int = 10) -> str:
+    """Export profiles as tree structure to TXT file (blocking)"""
     if not profiles:
         console.print("[yellow]No profiles to export[/]")
         return None
 
+    # One timestamp for both the filename and the header
+    now = datetime.now()
+
     if not filename:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"linkedin_leads_tree_{timestamp}.txt"
 
     if not filename.endswith('.txt'):
@@ -134,98 +201,88 @@ async def export_to_tree(profiles: List[Dict], output_dir: str, filename: str =
 
     filepath = Path(output_dir) / filename
 
-    # Build parent-child relationships
+    # Build parent-child relationships, roots and profile text in a single pass
     children_map = defaultdict(list)
+    root_profiles = []
+    text_of = {}
     for profile in profiles:
         source = profile.get('source_urn', '')
         if source:
             children_map[source].append(profile)
-
-    # Find root profiles (depth 0)
-    root_profiles = [p for p in profiles if p.get('depth_level', 0) == 0]
+        if profile.get('depth_level', 0) == 0:
+            root_profiles.append(profile)
+        text_of[profile['urn']] = _tree_text_parts(profile)
 
     if not root_profiles:
         console.print("[yellow]No root profiles found[/]")
         return None
 
-    # Generate tree text
-    tree_lines = []
-    tree_lines.append("=" * 80)
-    tree_lines.append("LinkedIn Discovery Tree")
-    tree_lines.append(f"Total Profiles: {len(profiles)}")
-    tree_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    tree_lines.append("=" * 80)
-    tree_lines.append("")
-
     def get_profile_text(profile: Dict) -> str:
-        """Generate text representation of profile"""
-        name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}".strip()
-        if not name:
-            name = profile.get('username', 'Unknown')
-
-        headline = profile.get('headline', 'No headline')
-        username = profile.get('username', 'N/A')
-        children_count = len(children_map.get(profile['urn'], []))
-
-        # Get location
-        geo = profile.get('geo', {})
-        location = geo.get('full', '') if geo else ''
-
-        text = f"{name} | {headline}"
-        if location:
-            text += f" | {location}"
+        """Join a profile's text with its child count, known once all profiles are scanned"""
+        summary, link = text_of[profile['urn']]
+        children_count = len(children_map.get(profile['urn'], ()))
         if children_count > 0:
-            text += f" ({children_count} discovered)"
-        text += f"\n    LinkedIn: linkedin.com/in/{username}"
-
-        return text
-
-    def add_children_to_tree(profile: Dict, prefix: str = "", is_last: bool = True, current_depth: int = 0, max_depth: int = 5):
-        """Recursively add children to tree text"""
-        if current_depth >= max_depth:
-            return
-
-        children = children_map.get(profile['urn'], [])
-        if not children:
-            return
-
-        # Show first N children
-        visible_children = children[:max_children_per_node]
-        hidden_count = len(children) - len(visible_children)
-
-        for i, child in enumerate(visible_children):
-            is_child_last = (i == len(visible_children) - 1) and (hidden_count == 0)
-
-            # Determine the branch characters
-            if is_child_last:
-                tree_lines.append(f"{prefix}└── {get_profile_text(child)}")
-                child_prefix = prefix + "    "
-            else:
-                tree_lines.append(f"{prefix}├── {get_profile_text(child)}")
-                child_prefix = prefix + "│   "
-
-            # Recursively add grandchildren
-            add_children_to_tree(child, child_prefix, is_child_last, current_depth + 1, max_depth)
-
-        # Add summary for hidden children
-        if hidden_count > 0:
-            tree_lines.append(f"{prefix}└── ... and {hidden_count} more profiles")
-
-    # Build tree for each root profile
-    for i, root in enumerate(root_profiles):
-        is_last_root = (i == len(root_profiles) - 1)
-
-        tree_lines.append(get_profile_text(root))
-        add_children_to_tree(root, "", is_last_root, current_depth=0, max_depth=5)
-        tree_lines.append("")
+            summary += f" ({children_count} discovered)"
+        return summary + link
 
-    tree_lines.append("")
-    tree_lines.append("=" * 80)
-    tree_lines.append(f"End of Tree - {len(profiles)} total profiles")
-    tree_lines.append("=" * 80)
+    max_depth = 5
 
-    # Write to file
     with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(tree_lines))
+        f.write("=" * 80 + "\n")
+        f.write("LinkedIn Discovery Tree\n")
+        f.write(f"Total Profiles: {len(profiles)}\n")
+        f.write(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write("=" * 80 + "\n")
+        f.write("\n")
+
+        # Stack entries: (line prefix, profile or None for a summary line, prefix for its children, depth)
+        stack = []
+
+        def push_children(profile: Dict, prefix: str, current_depth: int):
+            """Push visible children in reverse so they pop in display order"""
+            if current_depth >= max_depth:
+                return
+
+            children = children_map.get(profile['urn'], [])
+            if not children:
+                return
+
+            # Show first N children
+            visible_children = children[:max_children_per_node]
+            hidden_count = len(children) - len(visible_children)
+
+            # Summary for hidden children is written after all visible ones
+            if hidden_count > 0:
+                stack.append((f"{prefix}└── ... and {hidden_count} more profiles", None, None, None))
+
+            for i in range(len(visible_children) - 1, -1, -1):
+                is_child_last = (i == len(visible_children) - 1) and (hidden_count == 0)
+
+                # Determine the branch characters
+                if is_child_last:
+                    stack.append((prefix + "└── ", visible_children[i], prefix + "    ", current_depth + 1))
+                else:
+                    stack.append((prefix + "├── ", visible_children[i], prefix + "│   ", current_depth + 1))
+
+        # Build tree for each root profile
+        for root in root_profiles:
+            f.write(get_profile_text(root) + "\n")
+            push_children(root, "", 0)
+
+            while stack:
+                line_prefix, profile, child_prefix, current_depth = stack.pop()
+                if profile is None:
+                    f.write(line_prefix + "\n")
+                    continue
+
+                f.write(line_prefix + get_profile_text(profile) + "\n")
+                push_children(profile, child_prefix, current_depth)
+
+            f.write("\n")
+
+        f.write("\n")
+        f.write("=" * 80 + "\n")
+        f.write(f"End of Tree - {len(profiles)} total profiles\n")
+        f.write("=" * 80)
 
     return str(filepath)
\ No newline at end of file